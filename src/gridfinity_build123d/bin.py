@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from build123d import (
@@ -18,6 +19,7 @@ from build123d import (
     Plane,
     Polyline,
     RotationLike,
+    Sketch,
     Wire,
     add,
     extrude,
@@ -26,6 +28,7 @@ from build123d import (
     sweep,
 )
 
+from .constants import gridfinity_standard
 from .utils import Direction, StackProfile, Utils
 
 if TYPE_CHECKING:
@@ -69,15 +72,22 @@ class Bin(BasePartObject):
         with BuildPart() as part:
             add(base)
             if height_in_units:
-                bin_height = height_in_units * 7 - part.part.bounding_box().size.Z
+                bin_height = (
+                    height_in_units * gridfinity_standard.grid.height_unit
+                    - part.part.bounding_box().size.Z
+                )
             else:
                 bin_height = height
 
             face = part.faces().sort_by(Axis.Z)[-1]
             extrude(to_extrude=face, amount=bin_height)
+
+            if compartments or lip:
+                # Compartments are cut downwards from the top, so the top stays at top_z.
+                top_z = part.part.bounding_box().max.Z
+
             if compartments:
-                part_bbox = part.part.bounding_box()
-                with Locations((0, 0, part_bbox.max.Z)):
+                with Locations((0, 0, top_z)):
                     compartments.create(
                         size_x=face.length,
                         size_y=face.width,
@@ -87,7 +97,7 @@ class Bin(BasePartObject):
                     )
 
             if lip:
-                with Locations((0, 0, part.part.bounding_box().max.Z)):
+                with Locations((0, 0, top_z)):
                     lip.create(
                         Utils.get_face_by_direction(part, Direction.TOP).outer_wire(),
                     )
@@ -118,6 +128,28 @@ class StackingLip:
             BasePartObject: 3d object
         """
         path.move(Location((0, 0, -path.center().Z)))
+        profile = StackingLip._get_profile()
+        profile_width = profile.bounding_box().max.X
+
+        with BuildPart() as part:
+            with BuildSketch(Plane.XZ) as sweep_sketch:
+                edge = (
+                    path.edges()
+                    .sort_by(Axis.X)
+                    .filter_by(lambda edge: edge.find_intersection_points(Axis.X))
+                    .sort_by(Axis.X)[-1]
+                )
+                point = edge.find_intersection_points(Axis.X)[0]
+
+                with Locations((point.X, point.Z)), Locations((-profile_width, 0)):
+                    add(profile)
+            sweep(sections=sweep_sketch.sketch, path=path)
+
+        return BasePartObject(part.part, rotation, align, mode)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_profile() -> Sketch:
         with BuildSketch() as profile:
             StackProfile(StackProfile.ProfileType.BIN)
             vertex = profile.vertices().sort_by(Axis.Y)[-1]
@@ -137,20 +169,5 @@ class StackingLip:
                     close=True,
                 )
             make_face()
-        with BuildPart() as part:
-            with BuildSketch(Plane.XZ) as sweep_sketch:
-                edge = (
-                    path.edges()
-                    .sort_by(Axis.X)
-                    .filter_by(lambda edge: edge.find_intersection_points(Axis.X))
-                    .sort_by(Axis.X)[-1]
-                )
-                point = edge.find_intersection_points(Axis.X)[0]
-
-                with Locations((point.X, point.Z)), Locations(
-                    (-profile.sketch.bounding_box().max.X, 0),
-                ):
-                    add(profile)
-            sweep(sections=sweep_sketch.sketch, path=path)
-
-        return BasePartObject(part.part, rotation, align, mode)
+        profile_sketch: Sketch = profile.sketch
+        return profile_sketch
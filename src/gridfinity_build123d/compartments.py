@@ -13,6 +13,7 @@ from build123d import (
     Locations,
     Mode,
     RotationLike,
+    add,
     fillet,
 )
 
@@ -165,6 +166,9 @@ class Compartments:
         size_unit_x = distribute_area_x / len(self.grid[0])
         size_unit_y = distribute_area_y / len(self.grid)
 
+        # Compartments sharing the same Compartment object and size are built only once.
+        cutters: dict[tuple[int, float, float], BasePartObject] = {}
+
         with BuildPart() as part:
             numbers_proccesed = []
             for r_index, row in enumerate(self.grid):
@@ -196,18 +200,26 @@ class Compartments:
                             * -1
                         )
 
-                        with Locations((loc_x, loc_y)):
-                            if isinstance(self.compartment_list, Iterable):
-                                create_call = self.compartment_list[item - 1].create
-                            else:
-                                create_call = self.compartment_list.create
-
-                            create_call(
-                                size_x=size_unit_x * units_x - self.inner_wall,
-                                size_y=size_unit_y * units_y - self.inner_wall,
+                        if isinstance(self.compartment_list, Iterable):
+                            compartment = self.compartment_list[item - 1]
+                        else:
+                            compartment = self.compartment_list
+
+                        comp_size_x = size_unit_x * units_x - self.inner_wall
+                        comp_size_y = size_unit_y * units_y - self.inner_wall
+
+                        key = (id(compartment), comp_size_x, comp_size_y)
+                        if key not in cutters:
+                            cutters[key] = compartment.create(
+                                size_x=comp_size_x,
+                                size_y=comp_size_y,
                                 height=height,
+                                mode=Mode.PRIVATE,
                             )
 
+                        with Locations((loc_x, loc_y)):
+                            add(cutters[key])
+
         return BasePartObject(part=part.part, rotation=rotation, align=align, mode=mode)
 
     @staticmethod
@@ -23,6 +23,7 @@ class gridfinity_standard:
         """Grid constants."""
 
         size = 42
+        height_unit = 7
         radius = 4
         tollerance = 0.5
 
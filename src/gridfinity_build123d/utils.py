@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from copy import copy
 from enum import Enum, auto
+from functools import lru_cache
 from typing import Any
 
 from build123d import (
     Align,
-    Axis,
     BasePartObject,
     BaseSketchObject,
     BuildLine,
@@ -24,6 +25,7 @@ from build123d import (
     Polyline,
     RectangleRounded,
     RotationLike,
+    Vector,
     add,
     extrude,
     make_face,
@@ -46,9 +48,31 @@ class UnsuportedEnumValueError(Exception):
         super().__init__(f"Unsuported enum value: {enum_var}")
 
 
+def _walk_subclasses(class_name: type) -> tuple[type, ...]:
+    classes: list[type] = []
+    # Children are pushed reversed to keep the depth first order of a recursive walk.
+    stack = class_name.__subclasses__()[::-1]
+
+    while stack:
+        subclass = stack.pop()
+        classes.append(subclass)
+        stack += subclass.__subclasses__()[::-1]
+
+    return tuple(classes)
+
+
+# Only used for ObjectCreate roots, whose cache is cleared by ObjectCreate.__init_subclass__.
+_get_subclasses_cached = lru_cache(maxsize=None)(_walk_subclasses)
+
+
 class ObjectCreate(ABC):
     """Interface for object forcing to implement create_obj."""
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        """Invalidate the subclass cache when a new object type is defined."""
+        super().__init_subclass__(**kwargs)
+        _get_subclasses_cached.cache_clear()
+
     @abstractmethod
     def create_obj(
         self,
@@ -79,12 +103,12 @@ class Direction(Enum):
     Direction can be converted to a tuple.
     """
 
-    TOP = auto()
-    BOT = auto()
-    RIGHT = auto()
-    LEFT = auto()
-    BACK = auto()
-    FRONT = auto()
+    TOP = (0, 0, 1)
+    BOT = (0, 0, -1)
+    RIGHT = (1, 0, 0)
+    LEFT = (-1, 0, 0)
+    BACK = (0, 1, 0)
+    FRONT = (0, -1, 0)
 
     @staticmethod
     def to_tuple(direction: Direction) -> tuple[int, int, int]:
@@ -93,31 +117,15 @@ class Direction(Enum):
         Args:
             direction (Direction): Direction to convert.
 
-        Raises:
-            ValueError: Unkonw Direction.
-
         Returns:
             Tuple[int, int, int]: Output tupple.
         """
-        if direction == Direction.TOP:
-            return (0, 0, 1)
-
-        if direction == Direction.BOT:
-            return (0, 0, -1)
-
-        if direction == Direction.RIGHT:
-            return (1, 0, 0)
-
-        if direction == Direction.LEFT:
-            return (-1, 0, 0)
-
-        if direction == Direction.BACK:
-            return (0, 1, 0)
+        return direction.value
 
-        if direction == Direction.FRONT:
-            return (0, -1, 0)
 
-        raise UnsuportedEnumValueError(direction)  # pragma: no cover
+_DIRECTION_VECTORS = {
+    direction: Vector(*direction.value) for direction in Direction
+}
 
 
 class Attach(Enum):
@@ -134,6 +142,17 @@ class Attach(Enum):
     FRONT = auto()
 
 
+# Axis index and direction along that axis for each Attach value.
+_ATTACH_AXIS_SIGN: dict[Attach, tuple[int, int]] = {
+    Attach.TOP: (2, 1),
+    Attach.BOTTOM: (2, -1),
+    Attach.RIGHT: (0, 1),
+    Attach.LEFT: (0, -1),
+    Attach.BACK: (1, 1),
+    Attach.FRONT: (1, -1),
+}
+
+
 class Utils:  # pylint: disable=too-few-public-methods
     """Utils.
 
@@ -160,61 +179,22 @@ class Utils:  # pylint: disable=too-few-public-methods
         Raises:
             UnsuportedEnumValueError: Unsuported Enum value
         """
-        location: tuple[float, float, float] = (0, 0, 0)
-
-        if attach == Attach.TOP:
-            location = (
-                0,
-                0,
-                context.part.bounding_box().max.Z
-                + -1 * part.bounding_box().min.Z
-                + offset_value,
-            )
-        elif attach == Attach.BOTTOM:
-            location = (
-                0,
-                0,
-                context.part.bounding_box().min.Z
-                + -1 * part.bounding_box().max.Z
-                - offset_value,
-            )
-        elif attach == Attach.LEFT:
-            location = (
-                context.part.bounding_box().min.X
-                + -1 * part.bounding_box().max.X
-                - offset_value,
-                0,
-                0,
-            )
-        elif attach == Attach.RIGHT:
-            location = (
-                context.part.bounding_box().max.X
-                + -1 * part.bounding_box().min.X
-                + offset_value,
-                0,
-                0,
-            )
-        elif attach == Attach.FRONT:
-            location = (
-                0,
-                context.part.bounding_box().min.Y
-                + -1 * part.bounding_box().max.Y
-                - offset_value,
-                0,
-            )
-        elif attach == Attach.BACK:
-            location = (
-                0,
-                context.part.bounding_box().max.Y
-                + -1 * part.bounding_box().min.Y
-                + offset_value,
-                0,
-            )
-        else:  # pragma: no cover
-            raise UnsuportedEnumValueError(attach)
-
-        with Locations(location):
-            add(part)
+        try:
+            axis, sign = _ATTACH_AXIS_SIGN[attach]
+        except KeyError:  # pragma: no cover
+            raise UnsuportedEnumValueError(attach) from None
+
+        ctx_bb = context.part.bounding_box()
+        part_bb = part.bounding_box()
+        ctx_side = ctx_bb.max if sign > 0 else ctx_bb.min
+        part_side = part_bb.min if sign > 0 else part_bb.max
+
+        location = [0.0, 0.0, 0.0]
+        location[axis] = (
+            ctx_side.to_tuple()[axis] - part_side.to_tuple()[axis] + sign * offset_value
+        )
+
+        add(part.moved(Location(Vector(*location))))
 
     @staticmethod
     def get_face_by_direction(context: BuildPart, direction: Direction) -> Face:
@@ -227,27 +207,29 @@ class Utils:  # pylint: disable=too-few-public-methods
         Returns:
             Face: face
         """
-        return context.faces().sort_by(Axis((0, 0, 0), Direction.to_tuple(direction)))[
-            -1
-        ]
+        axis_vector = _DIRECTION_VECTORS[direction]
+        # Iterate reversed so ties resolve to the same face as sort_by(...)[-1] did.
+        return max(
+            reversed(context.faces()),
+            key=lambda face: face.center().dot(axis_vector),
+        )
 
     @staticmethod
     def get_subclasses(class_name: type) -> list[Any]:
         """Get subclasses of a base class recursively.
 
+        Results for ObjectCreate classes are cached. The cache is cleared whenever a new
+        ObjectCreate subclass is defined. Other classes are walked on every call.
+
         Args:
             class_name (Any): class type to get subcalsses from
 
         Returns:
             Any: list of child class types
         """
-        classes = []
-
-        for subclass in class_name.__subclasses__():
-            classes.append(subclass)
-            classes += Utils.get_subclasses(subclass)
-
-        return classes
+        if issubclass(class_name, ObjectCreate):
+            return list(_get_subclasses_cached(class_name))
+        return list(_walk_subclasses(class_name))
 
     @staticmethod
     def place_by_grid(
@@ -277,13 +259,7 @@ class Utils:  # pylint: disable=too-few-public-methods
         width = bbox.size.X
         length = bbox.size.Y
 
-        locations: list[Location] = []
-        for row_nr, row_value in enumerate(grid):
-            for column_nr, column_value in enumerate(row_value):
-                if column_value:
-                    locations.append(
-                        Location((width * (column_nr + 1), length * -(row_nr + 1))),
-                    )
+        locations = Utils._grid_to_locations(grid, width, length)
 
         if not locations:
             msg = f"grid {grid} does not reasemble locations"
@@ -294,6 +270,19 @@ class Utils:  # pylint: disable=too-few-public-methods
 
         return BasePartObject(part.part, rotation, align, mode)
 
+    @staticmethod
+    def _grid_to_locations(
+        grid: list[list[bool]],
+        width: float,
+        length: float,
+    ) -> list[tuple[float, float]]:
+        return [
+            (width * (column_nr + 1), -length * (row_nr + 1))
+            for row_nr, row_value in enumerate(grid)
+            for column_nr, column_value in enumerate(row_value)
+            if column_value
+        ]
+
     @staticmethod
     def create_profile_block(
         profile_type: StackProfile.ProfileType,
@@ -315,12 +304,21 @@ class Utils:  # pylint: disable=too-few-public-methods
         Returns:
             BasePartObject: _description_
         """
+        profile_block = Utils._create_profile_block_part(profile_type, offset_value)
+        # BasePartObject moves the part in place when aligning, so hand over a copy.
+        return BasePartObject(copy(profile_block), rotation, align, mode)
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _create_profile_block_part(
+        profile_type: StackProfile.ProfileType,
+        offset_value: float,
+    ) -> Part:
+        grid = gridfinity_standard.grid
+
         with BuildPart() as part:
             with BuildSketch(Plane.XZ) as profile, Locations(
-                (
-                    gridfinity_standard.grid.size / 2 - offset_value,
-                    0,
-                ),
+                (grid.size / 2 - offset_value, 0),
             ):
                 StackProfile(profile_type, align=(Align.MAX, Align.MIN))
                 if offset_value:
@@ -330,16 +328,19 @@ class Utils:  # pylint: disable=too-few-public-methods
                     )
 
             with BuildSketch() as rect:
-                RectangleRounded(
-                    gridfinity_standard.grid.size,
-                    gridfinity_standard.grid.size,
-                    gridfinity_standard.grid.radius,
-                )
-            extrude(to_extrude=rect.face(), amount=profile.sketch.bounding_box().max.Z)
-
-            path = part.wires().sort_by(Axis.Z)[-1]
+                RectangleRounded(grid.size, grid.size, grid.radius)
+            if offset_value:
+                # The offset extends the profile top by a corner dependent amount.
+                block_height = profile.sketch.bounding_box().max.Z
+            else:
+                block_height = StackProfile.height(profile_type)
+            extrude(to_extrude=rect.face(), amount=block_height)
+
+            # The top wire of the block is the rectangle outline lifted to the block height.
+            path = rect.face().outer_wire().moved(Location((0, 0, block_height)))
             sweep(sections=profile.sketch, path=path, mode=Mode.SUBTRACT)
-        return BasePartObject(part.part, rotation, align, mode)
+        profile_block: Part = part.part
+        return profile_block
 
 
 class StackProfile(BaseSketchObject):
@@ -369,38 +370,51 @@ class StackProfile(BaseSketchObject):
                 object. Defaults to None.
             mode (Mode, optional): Combination mode. Defaults to Mode.ADD.
         """
-        if stack_type == StackProfile.ProfileType.BIN:
-            height_3 = gridfinity_standard.stacking_lip.height_3_bin
-        elif stack_type == StackProfile.ProfileType.PLATE:
-            height_3 = gridfinity_standard.stacking_lip.height_3_base_plate
-        else:  # pragma: no cover
-            msg = "Unkown stack_type"
-            raise ValueError(msg)
+        profile_face = StackProfile._create_face(stack_type)
+        # BaseSketchObject moves the face in place when aligning, so hand over a copy.
+        super().__init__(copy(profile_face), rotation, align, mode)
+
+    @staticmethod
+    def height(stack_type: StackProfile.ProfileType) -> float:
+        """Get the height of the profile without creating it.
 
+        Args:
+            stack_type (ProfileType): Type of stacking lip (Bin vs Plate).
+
+        Returns:
+            float: height of the profile.
+        """
+        return max(y for _, y in _STACK_PROFILE_POINTS[stack_type])
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _create_face(stack_type: StackProfile.ProfileType) -> Face:
         with BuildSketch() as profile:
             with BuildLine():
-                Polyline(
-                    (0, 0),
-                    (
-                        gridfinity_standard.stacking_lip.height_1,
-                        gridfinity_standard.stacking_lip.height_1,
-                    ),
-                    (
-                        gridfinity_standard.stacking_lip.height_1,
-                        gridfinity_standard.stacking_lip.height_1
-                        + gridfinity_standard.stacking_lip.height_2,
-                    ),
-                    (
-                        gridfinity_standard.stacking_lip.height_1 + height_3,
-                        gridfinity_standard.stacking_lip.height_1
-                        + gridfinity_standard.stacking_lip.height_2
-                        + height_3,
-                    ),
-                    (
-                        gridfinity_standard.stacking_lip.height_1 + height_3,
-                        0,
-                    ),
-                    close=True,
-                )
+                Polyline(*_STACK_PROFILE_POINTS[stack_type], close=True)
             make_face()
-        super().__init__(profile.face(), rotation, align, mode)
+        face: Face = profile.face()
+        return face
+
+
+def _stack_profile_points(height_3: float) -> tuple[tuple[float, float], ...]:
+    height_1 = gridfinity_standard.stacking_lip.height_1
+    height_2 = gridfinity_standard.stacking_lip.height_2
+
+    return (
+        (0, 0),
+        (height_1, height_1),
+        (height_1, height_1 + height_2),
+        (height_1 + height_3, height_1 + height_2 + height_3),
+        (height_1 + height_3, 0),
+    )
+
+
+_STACK_PROFILE_POINTS = {
+    StackProfile.ProfileType.BIN: _stack_profile_points(
+        gridfinity_standard.stacking_lip.height_3_bin,
+    ),
+    StackProfile.ProfileType.PLATE: _stack_profile_points(
+        gridfinity_standard.stacking_lip.height_3_base_plate,
+    ),
+}
@@ -1,46 +1,39 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from build123d import Align, BasePartObject, Box, Mode, RotationLike
 
+_DEFAULT_ROTATION = (0, 0, 0)
+_DEFAULT_ALIGN = (Align.CENTER, Align.CENTER, Align.CENTER)
+
 
 @dataclass
 class BoxAsMock:
-    def __init__(
-        self,
-        length: float,
-        width: float,
-        height: float,
-        rotation: RotationLike = None,
-        align: Align | tuple[Align, Align, Align] | None = None,
-        mode: Mode = None,
-    ) -> None:
-        self.length = length
-        self.width = width
-        self.height = height
-        self.rotation = rotation
-        self.align = align
-        self.mode = mode
-
-        self.created_objects: list[BasePartObject] = []
+    length: float
+    width: float
+    height: float
+    rotation: RotationLike | None = None
+    align: Align | tuple[Align, Align, Align] | None = None
+    mode: Mode | None = None
+
+    created_objects: list[BasePartObject] = field(default_factory=list, init=False)
 
     def create(
         self,
         *args: Any,  # noqa: ANN401,ARG002
-        rotation: RotationLike = (0, 0, 0),
-        align: Align | tuple[Align, Align, Align] = (
-            Align.CENTER,
-            Align.CENTER,
-            Align.CENTER,
-        ),
+        rotation: RotationLike = _DEFAULT_ROTATION,
+        align: Align | tuple[Align, Align, Align] = _DEFAULT_ALIGN,
         mode: Mode = Mode.ADD,
         **kwargs: Any,  # noqa: ANN401,ARG002
     ) -> BasePartObject:
-        self.rotation = rotation if not self.rotation else self.rotation
-        self.align = align if not self.align else self.align
-        self.mode = mode if not self.mode else self.mode
+        if self.rotation is None:
+            self.rotation = rotation
+        if self.align is None:
+            self.align = align
+        if self.mode is None:
+            self.mode = mode
 
         obj = Box(
             self.length,
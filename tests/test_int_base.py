@@ -1,4 +1,9 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import testutils
+from parameterized import parameterized  # type: ignore[import-untyped]
 
 from gridfinity_build123d import (
     Base,
@@ -8,49 +13,35 @@ from gridfinity_build123d import (
     ScrewHole,
 )
 
+if TYPE_CHECKING:
+    from gridfinity_build123d.features import ObjectFeature
 
-class BaseTest(testutils.UtilTestCase):
-    def test_base_default(self) -> None:
-        part = BaseEqual(grid_x=2, grid_y=3)
-
-        self.assertTrue(part.is_valid)
-        self.assertTrue(part.is_manifold)
-        bbox = part.bounding_box()
-        self.assertVectorAlmostEqual((83.5, 125.5, 7.803553390593281), bbox.size)
-        self.assertAlmostEqual(24921.63727353625, part.area)
-        self.assertAlmostEqual(73106.17327094806, part.volume)
-
-    def test_base_magnets(self) -> None:
-        part = BaseEqual(
-            grid_x=2,
-            grid_y=3,
-            features=MagnetHole(BottomCorners()),
-        )
-
-        self.assertTrue(part.is_valid)
-        self.assertTrue(part.is_manifold)
 
-        bbox = part.bounding_box()
-        self.assertVectorAlmostEqual((83.5, 125.5, 7.803553390593281), bbox.size)
-        self.assertAlmostEqual(26097.84956304029, part.area)
-        self.assertAlmostEqual(71194.82830050986, part.volume)
-
-    def test_base_magnets_and_screws(self) -> None:
-        part = BaseEqual(
-            grid_x=2,
-            grid_y=3,
-            features=[
-                MagnetHole(BottomCorners()),
-                ScrewHole(BottomCorners()),
+class BaseTest(testutils.UtilTestCase):
+    @parameterized.expand(  # type: ignore[misc]
+        [
+            [None, 24921.63727353625, 73106.17327094806],
+            [MagnetHole(BottomCorners()), 26097.84956304029, 71194.82830050986],
+            [
+                [MagnetHole(BottomCorners()), ScrewHole(BottomCorners())],
+                26912.15037885079,
+                70584.10268864287,
             ],
-        )
-
-        self.assertTrue(part.is_valid)
-        self.assertTrue(part.is_manifold)
+        ],
+    )
+    def test_base_equal(
+        self,
+        features: ObjectFeature | list[ObjectFeature] | None,
+        area: float,
+        volume: float,
+    ) -> None:
+        part = BaseEqual(grid_x=2, grid_y=3, features=features)
+
+        self.assertValidSolid(part)
         bbox = part.bounding_box()
         self.assertVectorAlmostEqual((83.5, 125.5, 7.803553390593281), bbox.size)
-        self.assertAlmostEqual(26912.15037885079, part.area)
-        self.assertAlmostEqual(70584.10268864287, part.volume)
+        self.assertAlmostEqual(area, part.area)
+        self.assertAlmostEqual(volume, part.volume)
 
     def test_base_grid(self) -> None:
         grid = [[True, True], [True, False]]
@@ -1,97 +1,99 @@
+from __future__ import annotations
+
 import unittest
-from unittest.mock import ANY, MagicMock, patch
+from unittest.mock import ANY, MagicMock, Mock, create_autospec, patch, sentinel
 
 import mocks
 import testutils
-from build123d import BuildPart, Vector
+from build123d import BuildPart, Mode, Vector
+from parameterized import parameterized  # type: ignore[import-untyped]
 
+from gridfinity_build123d import base
 from gridfinity_build123d.base import Base, BaseBlock, BaseEqual
 from gridfinity_build123d.features import ObjectFeature
 
 
-@patch("gridfinity_build123d.base.BaseBlock", autospec=True)
 class BaseTest(unittest.TestCase):
-    def test_base(self, base_mock: MagicMock) -> None:
-        mock_box = mocks.BoxAsMock(20, 20, 5)
-        base_mock.side_effect = mock_box.create
-
-        with BuildPart() as part:
-            Base()
-
-        base_mock.assert_called_once_with(features=[], mode=ANY)
-
-        bbox = part.part.bounding_box()
-        self.assertEqual(Vector(19.5, 19.5, 5), bbox.size)
-        self.assertAlmostEqual(1840.8932334555323, part.part.volume)
-
-    def test_base_1_2(self, base_mock: MagicMock) -> None:
+    base_block_template: MagicMock
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.base_block_template = create_autospec(BaseBlock)
+
+    def setUp(self) -> None:
+        self.base_mock = self.base_block_template
+        self.base_mock.reset_mock(side_effect=True)
+        patcher = patch.object(base, "BaseBlock", new=self.base_mock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @parameterized.expand(  # type: ignore[misc]
+        [
+            [None, (19.5, 19.5, 5), 1840.8932334555323],
+            [[[True], [True]], (19.5, 39.5, 5), 3790.893233455532],
+            [[[True, True]], (39.5, 19.5, 5), 3790.893233455532],
+            [[[True, True], [True, True]], (39.5, 39.5, 5), 7740.893233455531],
+        ],
+    )
+    def test_base(
+        self,
+        grid: list[list[bool]] | None,
+        size: tuple[float, float, float],
+        volume: float,
+    ) -> None:
         mock_box = mocks.BoxAsMock(20, 20, 5)
-        base_mock.side_effect = mock_box.create
+        self.base_mock.side_effect = mock_box.create
 
         with BuildPart() as part:
-            Base([[True], [True]])
+            Base(grid)
 
-        base_mock.assert_called_once_with(features=[], mode=ANY)
+        self.base_mock.assert_called_once_with(features=[], mode=ANY)
 
         bbox = part.part.bounding_box()
-        self.assertEqual(Vector(19.5, 39.5, 5), bbox.size)
-        self.assertAlmostEqual(3790.893233455532, part.part.volume)
+        self.assertEqual(Vector(*size), bbox.size)
+        self.assertAlmostEqual(volume, part.part.volume)
 
-    def test_base_2_1(self, base_mock: MagicMock) -> None:
+    def test_base_magnet_screw(self) -> None:
         mock_box = mocks.BoxAsMock(20, 20, 5)
-        base_mock.side_effect = mock_box.create
-
-        with BuildPart() as part:
-            Base([[True, True]])
+        self.base_mock.side_effect = mock_box.create
+        feature_1 = Mock()
+        feature_2 = Mock()
 
-        base_mock.assert_called_once_with(features=[], mode=ANY)
+        base_obj = Base([[True]], features=[feature_1, feature_2])
 
-        bbox = part.part.bounding_box()
-        self.assertEqual(Vector(39.5, 19.5, 5), bbox.size)
-        self.assertAlmostEqual(3790.893233455532, part.part.volume)
-
-    def test_base_2_2(self, base_mock: MagicMock) -> None:
-        mock_box = mocks.BoxAsMock(20, 20, 5)
-        base_mock.side_effect = mock_box.create
-
-        with BuildPart() as part:
-            Base([[True, True], [True, True]])
-
-        base_mock.assert_called_once_with(features=[], mode=ANY)
-
-        bbox = part.part.bounding_box()
-        self.assertEqual(Vector(39.5, 39.5, 5), bbox.size)
-        self.assertAlmostEqual(7740.893233455531, part.part.volume)
+        self.base_mock.assert_called_once_with(
+            features=[feature_1, feature_2],
+            mode=ANY,
+        )
 
-    def test_base_magnet_screw(self, base_mock: MagicMock) -> None:
-        mock_box = mocks.BoxAsMock(20, 20, 5)
-        base_mock.side_effect = mock_box.create
-        feature_1 = MagicMock()
-        feature_2 = MagicMock()
+        bbox = base_obj.bounding_box()
+        self.assertEqual(Vector(19.5, 19.5, 5), bbox.size)
+        self.assertAlmostEqual(1840.8932334555323, base_obj.volume)
 
-        with BuildPart() as part:
-            Base([[True]], features=[feature_1, feature_2])
 
-        base_mock.assert_called_once_with(features=[feature_1, feature_2], mode=ANY)
+class BaseEqualTest(unittest.TestCase):
+    base_mock: MagicMock
 
-        bbox = part.part.bounding_box()
-        self.assertEqual(Vector(19.5, 19.5, 5), bbox.size)
-        self.assertAlmostEqual(1840.8932334555323, part.part.volume)
+    @classmethod
+    def setUpClass(cls) -> None:
+        patcher = patch.object(Base, "__init__")
+        cls.base_mock = patcher.start()
+        cls.addClassCleanup(patcher.stop)
 
+    def setUp(self) -> None:
+        self.base_mock.reset_mock()
 
-@patch("gridfinity_build123d.base.Base.__init__")
-class BaseEqualTest(unittest.TestCase):
-    def test_base(self, base_mock: MagicMock) -> None:
-        features = MagicMock()
+    def test_base(self) -> None:
+        features = sentinel.features
 
         BaseEqual(2, 3, features=features)
 
-        base_mock.assert_called_once_with(
+        self.base_mock.assert_called_once_with(
             [[True, True], [True, True], [True, True]],
             features,
-            ANY,
-            ANY,
-            ANY,
+            (0, 0, 0),
+            None,
+            Mode.ADD,
         )
 
 
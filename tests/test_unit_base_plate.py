@@ -1,9 +1,13 @@
-from unittest.mock import ANY, MagicMock, patch
+from __future__ import annotations
+
+from unittest.mock import ANY, MagicMock, Mock, create_autospec, patch
 
 import mocks
 import testutils
-from build123d import BuildPart
+from build123d import BasePartObject, BuildPart, Mode
+from parameterized import parameterized  # type: ignore[import-untyped]
 
+from gridfinity_build123d import baseplate
 from gridfinity_build123d.baseplate import (
     BasePlate,
     BasePlateBlock,
@@ -13,6 +17,10 @@ from gridfinity_build123d.baseplate import (
     BasePlateEqual,
 )
 from gridfinity_build123d.features import Feature
+from gridfinity_build123d.utils import Utils
+
+# Module level, as a class attribute the autospec function would bind to the test case.
+_PLACE_BY_GRID_AUTOSPEC = create_autospec(Utils.place_by_grid)
 
 
 class BasePlateBlockFrameTest(testutils.UtilTestCase):
@@ -37,19 +45,26 @@ class BasePlateBlockFrameTest(testutils.UtilTestCase):
 
 
 class BasePlateBlockFullTest(testutils.UtilTestCase):
-    def test_base_plate_block_frame(self) -> None:
-        with BuildPart() as part:
-            BasePlateBlockFull().create_obj()
-        bbox = part.part.bounding_box()
-        self.assertVectorAlmostEqual((42, 42, 11.05), bbox.size)
-        self.assertAlmostEqual(12581.068231756662, part.part.volume)
-
-    def test_base_plate_block_frame_height(self) -> None:
+    @parameterized.expand(  # type: ignore[misc]
+        [[None, 11.05, 12581.068231756662], [10, 14.65, 18931.46823175665]],
+    )
+    def test_base_plate_block_frame(
+        self,
+        bottom_height: float | None,
+        height: float,
+        volume: float,
+    ) -> None:
+        # None leaves bottom_height out to check the default.
+        block = (
+            BasePlateBlockFull()
+            if bottom_height is None
+            else BasePlateBlockFull(bottom_height=bottom_height)
+        )
         with BuildPart() as part:
-            BasePlateBlockFull(bottom_height=10).create_obj()
+            block.create_obj()
         bbox = part.part.bounding_box()
-        self.assertVectorAlmostEqual((42, 42, 14.65), bbox.size)
-        self.assertAlmostEqual(18931.46823175665, part.part.volume)
+        self.assertVectorAlmostEqual((42, 42, height), bbox.size)
+        self.assertAlmostEqual(volume, part.part.volume)
 
     def test_base_plate_block_frame_feature(self) -> None:
         feature = MagicMock(spec=Feature)
@@ -64,82 +79,93 @@ class BasePlateBlockFullTest(testutils.UtilTestCase):
         self.assertAlmostEqual(12581.068231756662, part.part.volume)
 
 
-@patch("gridfinity_build123d.baseplate.Utils.place_by_grid", autospec=True)
 class BasePlateTest(testutils.UtilTestCase):
-    def test_base_plate(self, place_mock: MagicMock) -> None:
+    place_mock: MagicMock
+
+    def setUp(self) -> None:
+        self.place_mock = _PLACE_BY_GRID_AUTOSPEC
+        self.place_mock.reset_mock()
+        patcher = patch.object(Utils, "place_by_grid", new=self.place_mock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_base_plate(self) -> None:
         place_box = mocks.BoxAsMock(10, 10, 10)
-        place_mock.side_effect = place_box.create
+        self.place_mock.side_effect = place_box.create
 
-        grid = MagicMock()
-        with BuildPart() as part:
-            BasePlate(grid)
+        grid = Mock()
+        base_plate = BasePlate(grid)
 
-        place_mock.assert_called_once_with(ANY, grid)
+        self.place_mock.assert_called_once_with(ANY, grid)
 
-        bbox = part.part.bounding_box()
+        bbox = base_plate.bounding_box()
         self.assertVectorAlmostEqual((10, 10, 10), bbox.size)
-        self.assertAlmostEqual(862.6548245743672, part.part.volume)
+        self.assertAlmostEqual(862.6548245743672, base_plate.volume)
 
-    def test_base_plate_bpblock(self, place_mock: MagicMock) -> None:
+    def test_base_plate_bpblock(self) -> None:
         place_box = mocks.BoxAsMock(10, 10, 10)
-        place_mock.side_effect = place_box.create
+        self.place_mock.side_effect = place_box.create
 
         baseplate_block = MagicMock(spec=BasePlateBlock)
         bp_block_box = mocks.BoxAsMock(1, 1, 1)
         baseplate_block.create_obj.side_effect = bp_block_box.create
 
-        grid = MagicMock()
-        with BuildPart() as part:
-            BasePlate(grid, baseplate_block)
+        grid = Mock()
+        base_plate = BasePlate(grid, baseplate_block)
 
         baseplate_block.create_obj.assert_called_once()
-        place_mock.assert_called_once_with(bp_block_box.created_objects[0], grid)
+        self.place_mock.assert_called_once_with(
+            bp_block_box.created_objects[0],
+            grid,
+        )
 
-        bbox = part.part.bounding_box()
+        bbox = base_plate.bounding_box()
         self.assertVectorAlmostEqual((10, 10, 10), bbox.size)
-        self.assertAlmostEqual(862.6548245743672, part.part.volume)
+        self.assertAlmostEqual(862.6548245743672, base_plate.volume)
 
-    def test_base_plate_features(self, place_mock: MagicMock) -> None:
+    def test_base_plate_features(self) -> None:
         place_box = mocks.BoxAsMock(10, 10, 10)
-        place_mock.side_effect = place_box.create
+        self.place_mock.side_effect = place_box.create
         feature = MagicMock(spec=Feature)
 
-        grid = MagicMock()
-        with BuildPart() as part:
-            BasePlate(grid, features=feature)
+        grid = Mock()
+        base_plate = BasePlate(grid, features=feature)
 
         feature.apply.assert_called_once()
 
-        bbox = part.part.bounding_box()
+        bbox = base_plate.bounding_box()
         self.assertVectorAlmostEqual((10, 10, 10), bbox.size)
-        self.assertAlmostEqual(862.6548245743672, part.part.volume)
+        self.assertAlmostEqual(862.6548245743672, base_plate.volume)
 
 
-@patch("gridfinity_build123d.baseplate.BasePlate.__init__")
 class BasePlateEqualTest(testutils.UtilTestCase):
-    @patch("gridfinity_build123d.baseplate.BasePlateBlockFrame", autospec=True)
-    def test_base_plate_equal(
-        self,
-        bplateblock_mock: MagicMock,
-        bplate_mock: MagicMock,
-    ) -> None:
+    bplate_mock: MagicMock
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        patcher = patch.object(BasePlate, "__init__")
+        cls.bplate_mock = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
+    def setUp(self) -> None:
+        self.bplate_mock.reset_mock()
+
+    @patch.object(baseplate, "BasePlateBlockFrame")
+    def test_base_plate_equal(self, bplateblock_mock: MagicMock) -> None:
         features = MagicMock(spec=Feature)
 
         BasePlateEqual(size_x=2, size_y=3, features=features)
 
-        bplate_mock.assert_called_once_with(
+        self.bplate_mock.assert_called_once_with(
             [[True, True], [True, True], [True, True]],
             bplateblock_mock.return_value,
             features,
-            ANY,
-            ANY,
-            ANY,
+            (0, 0, 0),
+            None,
+            Mode.ADD,
         )
 
-    def test_base_plate_equal_block(
-        self,
-        bplate_mock: MagicMock,
-    ) -> None:
+    def test_base_plate_equal_block(self) -> None:
         block_mock = MagicMock(spec=BasePlateBlock)
         features = MagicMock(spec=Feature)
 
@@ -150,20 +176,26 @@ class BasePlateEqualTest(testutils.UtilTestCase):
             features=features,
         )
 
-        bplate_mock.assert_called_once_with(
+        self.bplate_mock.assert_called_once_with(
             [[True, True], [True, True], [True, True]],
             block_mock,
             features,
-            ANY,
-            ANY,
-            ANY,
+            (0, 0, 0),
+            None,
+            Mode.ADD,
         )
 
 
 class BasePlateBlockSkeletonTest(testutils.UtilTestCase):
-    def test_baseplateblockskeleton(self) -> None:
-        part = BasePlateBlockSkeleton().create_obj()
+    part: BasePartObject
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.part = BasePlateBlockSkeleton().create_obj()
 
-        bbox = part.bounding_box()
+    def test_baseplateblockskeleton_size(self) -> None:
+        bbox = self.part.bounding_box()
         self.assertVectorAlmostEqual((42, 42, 11.05), bbox.size)
-        self.assertAlmostEqual(6310.636342511634, part.volume)
+
+    def test_baseplateblockskeleton_volume(self) -> None:
+        self.assertAlmostEqual(6310.636342511634, self.part.volume)
@@ -11,6 +11,7 @@ from build123d import (
     BuildPart,
     BuildSketch,
     Mode,
+    Part,
     Polyline,
     RectangleRounded,
     Vector,
@@ -30,8 +31,7 @@ class BinTest(unittest.TestCase):
         base = Box(10, 10, 1)
         cmp_mock = MagicMock(spec=Compartments)
 
-        with BuildPart() as part:
-            Bin(base=base, height=20, compartments=cmp_mock)
+        bin_obj = Bin(base=base, height=20, compartments=cmp_mock)
 
         cmp_mock.create.assert_called_once_with(
             size_x=10.0,
@@ -41,16 +41,24 @@ class BinTest(unittest.TestCase):
             align=(Align.CENTER, Align.CENTER, Align.MAX),
         )
 
-        bbox = part.part.bounding_box()
+        bbox = bin_obj.bounding_box()
+        self.assertEqual(Vector(10, 10, 21), bbox.size)
+        self.assertAlmostEqual(2100, bin_obj.volume)
+
+    def test_bin_no_compartments_no_lip(self) -> None:
+        base = Box(10, 10, 1)
+
+        bin_obj = Bin(base=base, height=20)
+
+        bbox = bin_obj.bounding_box()
         self.assertEqual(Vector(10, 10, 21), bbox.size)
-        self.assertAlmostEqual(2100, part.part.volume)
+        self.assertAlmostEqual(2100, bin_obj.volume)
 
     def test_bin_height_in_units(self) -> None:
         base = Box(10, 10, 1)
         cmp_mock = MagicMock(spec=Compartments)
 
-        with BuildPart() as part:
-            Bin(base=base, height_in_units=4, compartments=cmp_mock)
+        bin_obj = Bin(base=base, height_in_units=4, compartments=cmp_mock)
 
         cmp_mock.create.assert_called_once_with(
             size_x=10.0,
@@ -60,17 +68,16 @@ class BinTest(unittest.TestCase):
             align=(Align.CENTER, Align.CENTER, Align.MAX),
         )
 
-        bbox = part.part.bounding_box()
+        bbox = bin_obj.bounding_box()
         self.assertEqual(Vector(10, 10, 28), bbox.size)
-        self.assertAlmostEqual(2800, part.part.volume)
+        self.assertAlmostEqual(2800, bin_obj.volume)
 
     def test_bin_lip(self) -> None:
         base = Box(10, 10, 1)
         cmp_mock = MagicMock(spec=Compartments)
         lip_mock = MagicMock(spec=StackingLip)
 
-        with BuildPart() as part:
-            Bin(base=base, height=20, compartments=cmp_mock, lip=lip_mock)
+        bin_obj = Bin(base=base, height=20, compartments=cmp_mock, lip=lip_mock)
 
         cmp_mock.create.assert_called_once_with(
             size_x=10.0,
@@ -82,9 +89,9 @@ class BinTest(unittest.TestCase):
 
         lip_mock.create.assert_called_once()
 
-        bbox = part.part.bounding_box()
+        bbox = bin_obj.bounding_box()
         self.assertEqual(Vector(10, 10, 21), bbox.size)
-        self.assertAlmostEqual(2100, part.part.volume)
+        self.assertAlmostEqual(2100, bin_obj.volume)
 
     def test_bin_height_and_height_in_units(self) -> None:
         self.assertRaises(
@@ -97,18 +104,27 @@ class BinTest(unittest.TestCase):
 
 
 class StackingLipTest(testutils.UtilTestCase):
-    def test_stackinglip(self) -> None:
+    part: Part
+
+    @classmethod
+    def setUpClass(cls) -> None:
         with BuildSketch() as sketch:
             RectangleRounded(100, 100, 5)
 
         with BuildPart() as part:
             StackingLip().create(sketch.wire())
 
-        self.assertVectorAlmostEqual((0, 0, 0.316689612), part.part.center())
+        cls.part = part.part
 
-        bbox = part.part.bounding_box()
+    def test_stackinglip_center(self) -> None:
+        self.assertVectorAlmostEqual((0, 0, 0.316689612), self.part.center())
+
+    def test_stackinglip_bbox(self) -> None:
+        bbox = self.part.bounding_box()
         self.assertVectorAlmostEqual((100, 100, 6.967157), bbox.size, 6)
-        self.assertAlmostEqual(4928.067652835152, part.part.volume)
+
+    def test_stackinglip_volume(self) -> None:
+        self.assertAlmostEqual(4928.067652835152, self.part.volume)
 
     def test_stackinglip_shape_challenging_wire_filter(self) -> None:
         length = 20
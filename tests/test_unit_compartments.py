@@ -6,9 +6,12 @@ from unittest.mock import MagicMock, call, patch
 import mocks
 from build123d import (
     BuildPart,
+    Mode,
     Vector,
 )
+from parameterized import parameterized  # type: ignore[import-untyped]
 
+from gridfinity_build123d import compartments
 from gridfinity_build123d.compartments import (
     Compartment,
     Compartments,
@@ -36,12 +39,17 @@ class CompartmentsTest(unittest.TestCase):
                 height=50,
             )
 
-        comp_mock.create.assert_called_once_with(size_x=94.0, size_y=94.0, height=50)
+        comp_mock.create.assert_called_once_with(
+            size_x=94.0,
+            size_y=94.0,
+            height=50,
+            mode=Mode.PRIVATE,
+        )
         bbox = part.part.bounding_box()
         self.assertEqual(Vector(10, 10, 10), bbox.size)
         self.assertAlmostEqual(1000, part.part.volume)
 
-    @patch("gridfinity_build123d.compartments.Compartment", autospec=True)
+    @patch.object(compartments, "Compartment", autospec=True)
     def test_compartments_default_compartment(self, comp_mock: MagicMock) -> None:
         comp_box = mocks.BoxAsMock(10, 10, 10)
         comp_mock.return_value.create.side_effect = comp_box.create
@@ -61,6 +69,7 @@ class CompartmentsTest(unittest.TestCase):
             size_x=94.0,
             size_y=94.0,
             height=50,
+            mode=Mode.PRIVATE,
         )
         bbox = part.part.bounding_box()
         self.assertEqual(Vector(10, 10, 10), bbox.size)
@@ -86,7 +95,12 @@ class CompartmentsTest(unittest.TestCase):
                 height=50,
             )
 
-        comp_mock.create.assert_called_once_with(size_x=94.0, size_y=94.0, height=50)
+        comp_mock.create.assert_called_once_with(
+            size_x=94.0,
+            size_y=94.0,
+            height=50,
+            mode=Mode.PRIVATE,
+        )
         bbox = part.part.bounding_box()
         self.assertEqual(Vector(10, 10, 10), bbox.size)
         self.assertAlmostEqual(1000, part.part.volume)
@@ -113,9 +127,24 @@ class CompartmentsTest(unittest.TestCase):
 
         comp_mock.create.assert_has_calls(
             [
-                call(size_x=14.833333333333334, size_y=94.0, height=50),
-                call(size_x=30.666666666666668, size_y=94.0, height=50),
-                call(size_x=46.5, size_y=94.0, height=50),
+                call(
+                    size_x=14.833333333333334,
+                    size_y=94.0,
+                    height=50,
+                    mode=Mode.PRIVATE,
+                ),
+                call(
+                    size_x=30.666666666666668,
+                    size_y=94.0,
+                    height=50,
+                    mode=Mode.PRIVATE,
+                ),
+                call(
+                    size_x=46.5,
+                    size_y=94.0,
+                    height=50,
+                    mode=Mode.PRIVATE,
+                ),
             ],
         )
 
@@ -143,14 +172,15 @@ class CompartmentsTest(unittest.TestCase):
                 height=50,
             )
 
+        # Compartment 4 has the same size as compartment 2 and reuses its cutter.
         comp_mock.create.assert_has_calls(
             [
-                call(size_x=46.5, size_y=94.0, height=50),
-                call(size_x=22.75, size_y=46.5, height=50),
-                call(size_x=22.75, size_y=94.0, height=50),
-                call(size_x=22.75, size_y=46.5, height=50),
+                call(size_x=46.5, size_y=94.0, height=50, mode=Mode.PRIVATE),
+                call(size_x=22.75, size_y=46.5, height=50, mode=Mode.PRIVATE),
+                call(size_x=22.75, size_y=94.0, height=50, mode=Mode.PRIVATE),
             ],
         )
+        self.assertEqual(3, comp_mock.create.call_count)
         bbox = part.part.bounding_box()
         self.assertEqual(Vector(69.375, 57.5, 10), bbox.size)
         self.assertAlmostEqual(4000, part.part.volume)
@@ -178,86 +208,84 @@ class CompartmentsTest(unittest.TestCase):
                 height=50,
             )
 
-        comp_mock_1.create.assert_called_once_with(size_x=46.5, size_y=94.0, height=50)
-        comp_mock_1.create.assert_called_once_with(size_x=46.5, size_y=94.0, height=50)
+        comp_mock_1.create.assert_called_once_with(
+            size_x=46.5,
+            size_y=94.0,
+            height=50,
+            mode=Mode.PRIVATE,
+        )
+        comp_mock_1.create.assert_called_once_with(
+            size_x=46.5,
+            size_y=94.0,
+            height=50,
+            mode=Mode.PRIVATE,
+        )
 
         bbox = part.part.bounding_box()
         self.assertEqual(Vector(57.5, 10.0, 10.0), bbox.size)
         self.assertAlmostEqual(2000, part.part.volume)
 
 
-@patch("gridfinity_build123d.compartments.Compartments.__init__", spec=Compartments)
 class CompartmentsEqualTest(unittest.TestCase):
-    @patch("gridfinity_build123d.compartments.Compartment", autospec=True)
-    def test_compartments_equal_default_compartment(
-        self,
-        comp_mock: MagicMock,
-        comps_mock: MagicMock,
-    ) -> None:
-        CompartmentsEqual(
-            div_x=1,
-            div_y=1,
-        )
+    comps_mock: MagicMock
 
-        comps_mock.assert_called_once_with(
-            grid=[[1]],
-            compartment_list=comp_mock.return_value,
-            inner_wall=1.2,
-            outer_wall=0.95,
-        )
+    @classmethod
+    def setUpClass(cls) -> None:
+        patcher = patch.object(Compartments, "__init__", spec=Compartments)
+        cls.comps_mock = patcher.start()
+        cls.addClassCleanup(patcher.stop)
 
-    def test_compartments_equal_one(self, comps_mock: MagicMock) -> None:
-        cmp_mock1 = MagicMock(spec=Compartment)
-        cmp_mock2 = MagicMock(spec=Compartment)
+    def setUp(self) -> None:
+        self.comps_mock.reset_mock()
 
+    @patch.object(compartments, "Compartment", autospec=True)
+    def test_compartments_equal_default_compartment(self, comp_mock: MagicMock) -> None:
         CompartmentsEqual(
             div_x=1,
             div_y=1,
-            compartment_list=[cmp_mock1, cmp_mock2],
         )
 
-        comps_mock.assert_called_once_with(
+        self.comps_mock.assert_called_once_with(
             grid=[[1]],
-            compartment_list=[cmp_mock1, cmp_mock2],
-            inner_wall=1.2,
-            outer_wall=0.95,
-        )
-
-    def test_compartments_equal_one_row(self, comps_mock: MagicMock) -> None:
-        cmp_mock1 = MagicMock(spec=Compartment)
-        cmp_mock2 = MagicMock(spec=Compartment)
-
-        CompartmentsEqual(
-            div_x=5,
-            div_y=1,
-            compartment_list=[cmp_mock1, cmp_mock2],
-        )
-
-        comps_mock.assert_called_once_with(
-            grid=[[1, 2, 3, 4, 5]],
-            compartment_list=[cmp_mock1, cmp_mock2],
+            compartment_list=comp_mock.return_value,
             inner_wall=1.2,
             outer_wall=0.95,
         )
 
-    def test_compartments_equal_multi(self, comps_mock: MagicMock) -> None:
+    @parameterized.expand(  # type: ignore[misc]
+        [
+            [1, 1, [[1]]],
+            [5, 1, [[1, 2, 3, 4, 5]]],
+            [
+                5,
+                5,
+                [
+                    [1, 2, 3, 4, 5],
+                    [6, 7, 8, 9, 10],
+                    [11, 12, 13, 14, 15],
+                    [16, 17, 18, 19, 20],
+                    [21, 22, 23, 24, 25],
+                ],
+            ],
+        ],
+    )
+    def test_compartments_equal(
+        self,
+        div_x: int,
+        div_y: int,
+        grid: list[list[int]],
+    ) -> None:
         cmp_mock1 = MagicMock(spec=Compartment)
         cmp_mock2 = MagicMock(spec=Compartment)
 
         CompartmentsEqual(
-            div_x=5,
-            div_y=5,
+            div_x=div_x,
+            div_y=div_y,
             compartment_list=[cmp_mock1, cmp_mock2],
         )
 
-        comps_mock.assert_called_once_with(
-            grid=[
-                [1, 2, 3, 4, 5],
-                [6, 7, 8, 9, 10],
-                [11, 12, 13, 14, 15],
-                [16, 17, 18, 19, 20],
-                [21, 22, 23, 24, 25],
-            ],
+        self.comps_mock.assert_called_once_with(
+            grid=grid,
             compartment_list=[cmp_mock1, cmp_mock2],
             inner_wall=1.2,
             outer_wall=0.95,
@@ -1,7 +1,8 @@
 from unittest import TestCase
+from unittest.mock import patch
 
 import testutils
-from build123d import Vector
+from build123d import Box, Location, Vector
 
 
 class TestUtilsTest(TestCase):
@@ -51,3 +52,20 @@ class TestUtilsTest(TestCase):
             vec_a,
             [vec_b],
         )
+
+    @patch.dict("os.environ", {"GRIDFINITY_FULL_VALIDATE": "1"})
+    def test_assertValidSolid_full(self) -> None:
+        testutils.UtilTestCase().assertValidSolid(Box(1, 1, 1))
+
+    @patch.dict("os.environ", {"GRIDFINITY_FULL_VALIDATE": "0"})
+    def test_assertValidSolid_cheap(self) -> None:
+        testutils.UtilTestCase().assertValidSolid(Box(1, 1, 1))
+
+    @patch.dict("os.environ", {"GRIDFINITY_FULL_VALIDATE": "0"})
+    def test_assertValidSolid_cheap_two_shells(self) -> None:
+        part = Box(1, 1, 1) + Box(1, 1, 1).moved(Location((5, 0, 0)))
+        self.assertRaises(
+            AssertionError,
+            testutils.UtilTestCase().assertValidSolid,
+            part,
+        )
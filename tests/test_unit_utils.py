@@ -2,11 +2,12 @@ from enum import Enum, auto
 from unittest import TestCase
 
 import testutils
-from build123d import Axis, Box, BuildPart, BuildSketch, Vector, add
+from build123d import Align, Axis, Box, BuildPart, BuildSketch, Vector, add
 
 from gridfinity_build123d.utils import (
     Attach,
     Direction,
+    ObjectCreate,
     StackProfile,
     UnsuportedEnumValueError,
     Utils,
@@ -31,6 +32,16 @@ class StackProfileTest(testutils.UtilTestCase):
         self.assertVectorAlmostEqual((2.6, 4.4, 0), bbox.size)
         self.assertEqual(6.8, sketch.sketch.area)
 
+    def test_profile_bin_aligned_does_not_move_cached_face(self) -> None:
+        with BuildSketch():
+            StackProfile(StackProfile.ProfileType.BIN, align=(Align.MAX, Align.MAX))
+
+        with BuildSketch() as sketch:
+            StackProfile(StackProfile.ProfileType.BIN)
+
+        bbox = sketch.sketch.bounding_box()
+        self.assertVectorAlmostEqual((0, 0, 0), bbox.min)
+
     def test_profile_plate(self) -> None:
         with BuildSketch() as sketch:
             StackProfile(StackProfile.ProfileType.PLATE)
@@ -39,6 +50,32 @@ class StackProfileTest(testutils.UtilTestCase):
         self.assertVectorAlmostEqual((2.85, 4.65, 0), bbox.size)
         self.assertEqual(7.9312499999999995, sketch.sketch.area)
 
+    def test_profile_height(self) -> None:
+        self.assertAlmostEqual(4.4, StackProfile.height(StackProfile.ProfileType.BIN))
+        self.assertAlmostEqual(
+            4.65,
+            StackProfile.height(StackProfile.ProfileType.PLATE),
+        )
+
+    def test_profile_face_cached(self) -> None:
+        with BuildSketch():
+            StackProfile(StackProfile.ProfileType.BIN)
+
+        with BuildSketch() as sketch:
+            StackProfile(StackProfile.ProfileType.BIN)
+
+        self.assertGreater(
+            StackProfile._create_face.cache_info().hits,  # noqa: SLF001
+            0,
+        )
+        self.assertEqual(6.8, sketch.sketch.area)
+
+
+class DirectionTest(TestCase):
+    def test_to_tuple(self) -> None:
+        self.assertEqual((0, 0, 1), Direction.to_tuple(Direction.TOP))
+        self.assertEqual((0, -1, 0), Direction.to_tuple(Direction.FRONT))
+
 
 class UtilsAttachTest(TestCase):
     def test_attach_top(self) -> None:
@@ -184,6 +221,42 @@ class UtilsGetSubclassesTest(TestCase):
 
         self.assertEqual([Child, ChildOfChild], Utils.get_subclasses(Base))
 
+    def test_get_subclass_depth_first_order(self) -> None:
+        class Base:
+            pass
+
+        class ChildA(Base):
+            pass
+
+        class ChildOfChildA(ChildA):
+            pass
+
+        class ChildB(Base):
+            pass
+
+        self.assertEqual([ChildA, ChildOfChildA, ChildB], Utils.get_subclasses(Base))
+
+    def test_get_subclass_defined_later(self) -> None:
+        class Base:
+            pass
+
+        classes = Utils.get_subclasses(Base)
+
+        class Child(Base):
+            pass
+
+        self.assertEqual([], classes)
+        self.assertEqual([Child], Utils.get_subclasses(Base))
+
+    def test_get_subclass_object_create_defined_later(self) -> None:
+        classes = Utils.get_subclasses(ObjectCreate)
+
+        class Child(ObjectCreate):
+            pass
+
+        self.assertNotIn(Child, classes)
+        self.assertIn(Child, Utils.get_subclasses(ObjectCreate))
+
 
 class UtilsPlaceByGridTest(TestCase):
     def test_place_by_grid_one(self) -> None:
@@ -230,3 +303,16 @@ class UtilsPlaceByGridTest(TestCase):
         box = Box(10, 15, 20)
         grid = [[False]]
         self.assertRaises(ValueError, Utils.place_by_grid, box, grid)
+
+
+class UtilsCreateProfileBlockTest(TestCase):
+    def test_create_profile_block_cached(self) -> None:
+        first = Utils.create_profile_block(StackProfile.ProfileType.PLATE)
+        second = Utils.create_profile_block(StackProfile.ProfileType.PLATE)
+
+        self.assertIsNot(first, second)
+        self.assertAlmostEqual(first.volume, second.volume)
+        self.assertGreater(
+            Utils._create_profile_block_part.cache_info().hits,  # noqa: SLF001
+            0,
+        )
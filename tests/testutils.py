@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import os
 from unittest import TestCase
 from unittest.util import safe_repr
 
-from build123d import Vector
+from build123d import Part, Vector
 
 
 class UtilTestCase(TestCase):
@@ -13,13 +14,22 @@ class UtilTestCase(TestCase):
         vector: Vector,
         places: int | None = None,
     ) -> None:
-        try:
-            self.assertAlmostEqual(compare[0], vector.X, places)
-            self.assertAlmostEqual(compare[1], vector.Y, places)
-            self.assertAlmostEqual(compare[2], vector.Z, places)
-        except AssertionError as e:  # pragma: no cover
-            msg = f"{Vector(compare)} != {vector}"
-            raise AssertionError(msg) from e
+        compare_vec = Vector(compare)
+        if not self._vec_almost_equal(
+            compare_vec,
+            vector,
+            7 if places is None else places,
+        ):  # pragma: no cover
+            msg = f"{compare_vec} != {vector}"
+            raise AssertionError(msg)
+
+    def assertValidSolid(self, part: Part) -> None:  # pylint: disable=invalid-name
+        if os.environ.get("GRIDFINITY_FULL_VALIDATE") == "1":
+            self.assertTrue(part.is_valid)
+            self.assertTrue(part.is_manifold)
+        else:
+            self.assertGreater(part.volume, 0)
+            self.assertEqual(1, len(part.shells()))
 
     def _isclose(self, a: float, b: float, places: int) -> bool:
         diff = abs(a - b)
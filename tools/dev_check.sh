@@ -6,9 +6,9 @@ python -m mypy --pretty ./src ./tests
 
 python -m ruff format --diff
 
-python -m vulture ./src
+python -m vulture ./src ./tools/vulture_whitelist.py
 
-python -m unittest discover ./tests -v -p "test_int*"
+python -m pytest -n auto -v ./tests/test_int_*.py
 
 python -m coverage run -m unittest discover ./tests/ -v -p "test_unit*"
 
@@ -0,0 +1,10 @@
+"""Vulture whitelist.
+
+ObjectCreate.__init_subclass__ only needs cls for its signature.
+"""
+
+from vulture.whitelist_utils import Whitelist  # type: ignore[import-untyped]
+
+_ = Whitelist()
+
+_.cls  # noqa: B018